@@ -1,9 +1,15 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-import random
 import time
 
+# Outcomes reported by MazeSimulator.solve
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
 class MazeCell:
     def __init__(self):
         self.walls = {'N': True, 'E': True, 'S': True, 'W': True}
@@ -26,19 +32,21 @@ class Micromouse:
         self.direction = directions[self.direction]
 
 class MazeSimulator:
-    def __init__(self, size=9):
+    def __init__(self, size=9, rng=None):
+        self.rng = np.random.default_rng(rng)
         self.size = size
         self.maze = [[MazeCell() for _ in range(size)] for _ in range(size)]
         self.mouse = Micromouse()
         self.goal = (size//2, size//2)
         self.frames = []
+        self.result = None
         
     def generate_maze(self):
         def recursive_backtracker(x, y):
             self.maze[y][x].visited = True
             directions = [(0, -1, 'N', 'S'), (1, 0, 'E', 'W'),
                          (0, 1, 'S', 'N'), (-1, 0, 'W', 'E')]
-            random.shuffle(directions)
+            self.rng.shuffle(directions)
             
             for dx, dy, wall1, wall2 in directions:
                 new_x, new_y = x + dx, y + dy
@@ -98,8 +106,14 @@ class MazeSimulator:
         
         return best_direction
     
+    def goal_unreachable(self):
+        # O(1) after a flood fill: the goal never reached the mouse's cell
+        return self.maze[self.mouse.y][self.mouse.x].distance == float('inf')
+    
     def move_mouse(self):
         next_direction = self.get_next_move()
+        if next_direction is None:
+            return False
         
         # Turn mouse to face the correct direction
         while self.mouse.direction != next_direction:
@@ -110,6 +124,7 @@ class MazeSimulator:
         self.mouse.x += dx
         self.mouse.y += dy
         self.mouse.visited_cells.add((self.mouse.x, self.mouse.y))
+        return True
     
     def draw_frame(self):
         fig, ax = plt.subplots(figsize=(8, 8))
@@ -155,25 +170,56 @@ class MazeSimulator:
         ax.grid(True)
         return fig
     
-    def solve(self):
+    def solve(self, max_steps=None, time_budget=None):
+        # Bounded by a step and a time budget, the outcome ends up in self.result
+        if max_steps is None:
+            max_steps = 4 * self.size * self.size
+        start = time.perf_counter()
+        steps = 0
+        seen_states = set()
+        outcome = REACHED
+        
         self.generate_maze()
         self.flood_fill()
         
         while (self.mouse.x, self.mouse.y) != self.goal:
+            if self.goal_unreachable():
+                outcome = UNREACHABLE
+                break
+            # The maze is fully known, so a repeated position and heading is a loop
+            state = (self.mouse.x, self.mouse.y, self.mouse.direction)
+            if state in seen_states:
+                outcome = CYCLE
+                break
+            seen_states.add(state)
+            if steps >= max_steps:
+                outcome = STEP_LIMIT
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                outcome = TIME_LIMIT
+                break
+            
             fig = self.draw_frame()
             self.frames.append(fig)
-            self.move_mouse()
+            if not self.move_mouse():
+                outcome = UNREACHABLE
+                break
+            steps += 1
             self.flood_fill()
         
         # Add final frame
         fig = self.draw_frame()
         self.frames.append(fig)
         
+        self.result = {'outcome': outcome, 'steps': steps,
+                       'position': (self.mouse.x, self.mouse.y),
+                       'elapsed': time.perf_counter() - start}
         return self.frames
 
 # Run the simulation
 simulator = MazeSimulator()
 frames = simulator.solve()
+print(f"Finished: {simulator.result}")
 
 # Display frames
 for i, frame in enumerate(frames):
@@ -10,8 +10,16 @@ class Direction(Enum):
     SOUTH = 2
     WEST = 3
 
+# Outcomes reported by MicroMouse.run
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
 class MicroMouse:
-    def __init__(self, maze_size=9):
+    def __init__(self, maze_size=9, rng=None):
+        self.rng = np.random.default_rng(rng)
         self.maze_size = maze_size
         self.position = [0, 0]  # Start at bottom-left corner
         self.direction = Direction.NORTH
@@ -20,6 +28,7 @@ class MicroMouse:
         # Initialize maze walls (unknown initially)
         self.walls = np.zeros((maze_size, maze_size, 4), dtype=bool)  # N,E,S,W walls for each cell
         self.known_walls = np.zeros((maze_size, maze_size, 4), dtype=bool)  # Discovered walls
+        self.walls_learned = 0  # Bumped whenever sensing reveals something new
         
         # Initialize flood fill values
         self.flood_values = np.full((maze_size, maze_size), float('inf'))
@@ -66,7 +75,7 @@ class MicroMouse:
                 directions.append(Direction.WEST.value)
             
             if directions:
-                direction = np.random.choice(directions)
+                direction = self.rng.choice(directions)
                 remove_wall(x, y, direction)
                 if direction == Direction.NORTH.value:
                     stack.append((x, y+1))
@@ -81,14 +90,16 @@ class MicroMouse:
         
         # Add additional paths (to ensure multiple solutions)
         for _ in range(self.maze_size):
-            x = np.random.randint(0, self.maze_size)
-            y = np.random.randint(0, self.maze_size)
-            direction = np.random.randint(0, 4)
+            x = self.rng.integers(0, self.maze_size)
+            y = self.rng.integers(0, self.maze_size)
+            direction = self.rng.integers(0, 4)
             remove_wall(x, y, direction)
     
     def sense_walls(self):
         x, y = self.position
         # Update known walls based on current position and direction
+        if (self.known_walls[y, x] != self.walls[y, x]).any():
+            self.walls_learned += 1
         self.known_walls[y, x] = self.walls[y, x]
     
     def update_flood_values(self):
@@ -123,6 +134,11 @@ class MicroMouse:
         
         self.flood_values = new_values
     
+    def goal_unreachable(self):
+        # O(1) after a flood fill: no known path leads from here to the goal
+        x, y = self.position
+        return self.flood_values[y, x] == float('inf')
+    
     def decide_next_move(self):
         x, y = self.position
         current_value = self.flood_values[y, x]
@@ -168,6 +184,8 @@ class MicroMouse:
                 self.position[1] -= 1
             elif next_direction == Direction.WEST:
                 self.position[0] -= 1
+            return True
+        return False
     
     def draw(self):
         self.ax.clear()
@@ -238,18 +256,48 @@ class MicroMouse:
         self.ax.set_aspect('equal')
         plt.pause(0.5)  # Pause to show the frame
     
-    def run(self):
+    def run(self, max_steps=None, time_budget=None):
+        # Bounded by a step and a time budget, returns a structured outcome
+        if max_steps is None:
+            max_steps = 4 * self.maze_size * self.maze_size
+        start = time.perf_counter()
+        steps = 0
+        seen_states = set()
+        outcome = REACHED
+        
         self.generate_maze()
         while tuple(self.position) != tuple(self.goal):
             self.sense_walls()
             self.update_flood_values()
+            if self.goal_unreachable():
+                outcome = UNREACHABLE
+                break
+            # Same cell, heading and wall knowledge as before means the mouse loops
+            state = (tuple(self.position), self.direction, self.walls_learned)
+            if state in seen_states:
+                outcome = CYCLE
+                break
+            seen_states.add(state)
+            if steps >= max_steps:
+                outcome = STEP_LIMIT
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                outcome = TIME_LIMIT
+                break
+            
             self.draw()
-            self.decide_next_move()
+            if not self.decide_next_move():
+                outcome = UNREACHABLE
+                break
+            steps += 1
         
         # Final draw
         self.draw()
         plt.show()
+        return {'outcome': outcome, 'steps': steps, 'position': tuple(self.position),
+                'elapsed': time.perf_counter() - start}
 
 # Create and run the simulation
 mouse = MicroMouse()
-mouse.run()
\ No newline at end of file
+result = mouse.run()
+print(f"Finished: {result}")
\ No newline at end of file
@@ -8,6 +8,13 @@ MAZE_SIZE = 9
 # Directions: 0=North, 1=East, 2=South, 3=West
 DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
 
+# Outcomes reported by the simulation loop
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
 # Initialize maze with walls (1 = wall, 0 = open)
 maze = np.zeros((MAZE_SIZE, MAZE_SIZE), dtype=int)
 
@@ -51,7 +58,11 @@ def update_flood_fill():
                 distances[ny][nx] = distances[y][x] + 1
                 queue.append((nx, ny))
 
-# Function to move the robot
+# Function to check, in O(1) after a fill, whether the goal can be reached
+def goal_unreachable(x, y):
+    return distances[y][x] == -1
+
+# Function to move the robot, returns False if there is no valid move
 def move_robot():
     global robot_pos, robot_dir
 
@@ -60,16 +71,22 @@ def move_robot():
 
     # Update flood fill distances
     update_flood_fill()
+    if goal_unreachable(x, y):
+        print("Goal unreachable")
+        return False
 
-    # Find the direction with the smallest distance
+    # Find the direction with the smallest distance, -1 marks cells cut off from the goal
     min_dist = float('inf')
-    best_dir = robot_dir
+    best_dir = None
     for i in range(4):
         dx, dy = DIRECTIONS[i]
         nx, ny = x + dx, y + dy
-        if is_valid(nx, ny) and not walls[i] and distances[ny][nx] < min_dist:
+        if is_valid(nx, ny) and not walls[i] and 0 <= distances[ny][nx] < min_dist:
             min_dist = distances[ny][nx]
             best_dir = i
+    if best_dir is None:
+        print("No valid moves")
+        return False
 
     # Turn the robot to the best direction
     if best_dir != robot_dir:
@@ -82,6 +99,8 @@ def move_robot():
     if is_valid(nx, ny) and not walls[robot_dir]:
         robot_pos = (nx, ny)
         print(f"Moving to {robot_pos}")
+        return True
+    return False
 
 # Function to visualize the maze and robot
 def visualize_maze():
@@ -92,14 +111,37 @@ def visualize_maze():
     plt.title("Micromouse Simulation")
     plt.pause(0.5)
 
-# Main simulation loop
-def simulate():
+# Main simulation loop, bounded by a step and a time budget
+def simulate(max_steps=4 * MAZE_SIZE * MAZE_SIZE, time_budget=None, delay=1):
+    start = time.perf_counter()
+    steps = 0
+    seen_states = set()
+    outcome = REACHED
     while robot_pos != goal:
+        # The maze is fully known, so revisiting a position and heading is a loop
+        state = (robot_pos, robot_dir)
+        if state in seen_states:
+            outcome = CYCLE
+            break
+        seen_states.add(state)
+        if steps >= max_steps:
+            outcome = STEP_LIMIT
+            break
+        if time_budget is not None and time.perf_counter() - start > time_budget:
+            outcome = TIME_LIMIT
+            break
+
         visualize_maze()
-        move_robot()
-        time.sleep(1)  # Pause to see the frame-by-frame movement
+        if not move_robot():
+            outcome = UNREACHABLE
+            break
+        steps += 1
+        time.sleep(delay)  # Pause to see the frame-by-frame movement
     visualize_maze()
-    print("Goal reached!")
+    result = {'outcome': outcome, 'steps': steps, 'position': robot_pos,
+              'elapsed': time.perf_counter() - start}
+    print("Goal reached!" if outcome == REACHED else f"Stopped: {outcome}")
+    return result
 
 # Example maze (1 = wall, 0 = open)
 maze = np.array([
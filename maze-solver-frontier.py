@@ -0,0 +1,325 @@
+import heapq
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Directions as in maze-solver-claude.py, N is y-1
+DIRECTIONS = {'N': (0, -1), 'E': (1, 0), 'S': (0, 1), 'W': (-1, 0)}
+OPPOSITE = {'N': 'S', 'E': 'W', 'S': 'N', 'W': 'E'}
+
+# Outcomes reported by solve_maze
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
+def generate_maze(size=9, extra_openings=0, rng=None):
+    # Recursive backtracker, walls[y][x] maps each side to True if walled.
+    # Extra openings knock out random inner walls to add loops.
+    rng = np.random.default_rng(rng)
+    walls = [[{side: True for side in DIRECTIONS} for _ in range(size)] for _ in range(size)]
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [(side, x + dx, y + dy) for side, (dx, dy) in DIRECTIONS.items()
+                   if 0 <= x + dx < size and 0 <= y + dy < size and (x + dx, y + dy) not in visited]
+        if options:
+            side, nx, ny = options[rng.integers(len(options))]
+            walls[y][x][side] = False
+            walls[ny][nx][OPPOSITE[side]] = False
+            visited.add((nx, ny))
+            stack.append((nx, ny))
+        else:
+            stack.pop()
+    for _ in range(extra_openings):
+        x, y = int(rng.integers(1, size)), int(rng.integers(size))
+        walls[y][x]['W'] = False
+        walls[y][x - 1]['E'] = False
+    return walls
+
+# Grid represents costs from center, robot position, and exploration status
+class MazeGrid:
+    def __init__(self, size=9):
+        self.size = size
+        self.center = (size // 2, size // 2)
+        self.costs = [[0] * size for _ in range(size)]
+        self.explored = [[False] * size for _ in range(size)]
+        self.explored_count = 0
+        # Known walls, unseen sides are assumed open apart from the outer edge
+        self.walls = [[{side: not (0 <= x + dx < size and 0 <= y + dy < size)
+                        for side, (dx, dy) in DIRECTIONS.items()}
+                       for x in range(size)] for y in range(size)]
+        self.walls_learned = 0
+
+    def initialize_cost_grid(self):
+        # Manhattan distance from the center, exact while no walls are known
+        cx, cy = self.center
+        for y in range(self.size):
+            for x in range(self.size):
+                self.costs[y][x] = abs(x - cx) + abs(y - cy)
+
+    def mark_cell_explored(self, x, y):
+        if not self.explored[y][x]:
+            self.explored[y][x] = True
+            self.explored_count += 1
+
+    def is_cell_explored(self, x, y):
+        return self.explored[y][x]
+
+    def neighbours(self, x, y):
+        for side, (dx, dy) in DIRECTIONS.items():
+            if not self.walls[y][x][side]:
+                yield x + dx, y + dy
+
+    def set_wall(self, x, y, side):
+        self.walls[y][x][side] = True
+        self.walls_learned += 1
+        dx, dy = DIRECTIONS[side]
+        if 0 <= x + dx < self.size and 0 <= y + dy < self.size:
+            self.walls[y + dy][x + dx][OPPOSITE[side]] = True
+
+    def update_costs(self):
+        # Flood fill from the center over the known walls, returns changed cells
+        costs = [[float('inf')] * self.size for _ in range(self.size)]
+        cx, cy = self.center
+        costs[cy][cx] = 0
+        queue = [self.center]
+        head = 0
+        while head < len(queue):
+            x, y = queue[head]
+            head += 1
+            for nx, ny in self.neighbours(x, y):
+                if costs[ny][nx] == float('inf'):
+                    costs[ny][nx] = costs[y][x] + 1
+                    queue.append((nx, ny))
+        changed = [(x, y) for y in range(self.size) for x in range(self.size)
+                   if costs[y][x] != self.costs[y][x]]
+        self.costs = costs
+        return changed
+
+class Robot:
+    def __init__(self, grid, maze):
+        # maze holds the real walls, the robot only learns them by scanning
+        self.grid = grid
+        self.maze = maze
+        self.x, self.y = 0, 0
+        self.steps = 0
+        self.grid.mark_cell_explored(self.x, self.y)
+
+    def scan_surrounding_walls(self):
+        return [side for side in DIRECTIONS if self.maze[self.y][self.x][side]]
+
+    def update_grid_walls(self, walls):
+        # Returns the cells whose cost changed
+        new_walls = [side for side in walls if not self.grid.walls[self.y][self.x][side]]
+        for side in new_walls:
+            self.grid.set_wall(self.x, self.y, side)
+        return self.grid.update_costs() if new_walls else []
+
+    def get_available_moves(self):
+        return list(self.grid.neighbours(self.x, self.y))
+
+    def find_lowest_cost_move(self, available_moves):
+        # Plain greedy flood-fill step, preferring unexplored cells on ties
+        if not available_moves:
+            return None
+        return min(available_moves,
+                   key=lambda cell: (self.grid.costs[cell[1]][cell[0]],
+                                     self.grid.is_cell_explored(*cell)))
+
+    def move_to_cell(self, x, y):
+        self.x, self.y = x, y
+        self.steps += 1
+        self.grid.mark_cell_explored(x, y)
+
+class FrontierRobot(Robot):
+    # Frontier-directed exploration. Unexplored cells next to explored ones
+    # sit in a heap keyed by their cost to the center minus a bonus for how
+    # much unexplored space they would reveal. The robot heads for the
+    # frontier cell with the lowest travel cost plus that key, backtracking
+    # through explored cells when its own neighbourhood is used up.
+    def __init__(self, grid, maze, gain_weight=0.5):
+        self.gain_weight = gain_weight
+        self.heap = []
+        self.version = {}
+        super().__init__(grid, maze)
+        self.push_frontier(self.x, self.y)
+
+    def information_gain(self, x, y):
+        cells = [(x, y)] + [(x + dx, y + dy) for dx, dy in DIRECTIONS.values()]
+        return sum(1 for cx, cy in cells
+                   if 0 <= cx < self.grid.size and 0 <= cy < self.grid.size
+                   and not self.grid.is_cell_explored(cx, cy))
+
+    def push(self, x, y):
+        # Re-key a frontier cell, older heap entries for it become stale
+        version = self.version.get((x, y), 0) + 1
+        self.version[(x, y)] = version
+        key = self.grid.costs[y][x] - self.gain_weight * self.information_gain(x, y)
+        heapq.heappush(self.heap, (key, version, (x, y)))
+
+    def push_frontier(self, x, y):
+        # Sensing (x, y) adds its unexplored neighbours and lowers the gain of
+        # frontier cells around it
+        for nx, ny in self.grid.neighbours(x, y):
+            if not self.grid.is_cell_explored(nx, ny):
+                self.push(nx, ny)
+        for dx, dy in DIRECTIONS.values():
+            cell = (x + dx, y + dy)
+            if cell in self.version and not self.grid.is_cell_explored(*cell):
+                self.push(*cell)
+
+    def update_grid_walls(self, walls):
+        changed = super().update_grid_walls(walls)
+        for x, y in changed:
+            if (x, y) in self.version and not self.grid.is_cell_explored(x, y):
+                self.push(x, y)
+        return changed
+
+    def travel_costs(self):
+        # BFS from the robot through explored cells, frontier cells are leaves
+        parent = {(self.x, self.y): None}
+        distance = {(self.x, self.y): 0}
+        queue = [(self.x, self.y)]
+        head = 0
+        while head < len(queue):
+            x, y = queue[head]
+            head += 1
+            for cell in self.grid.neighbours(x, y):
+                if cell not in distance:
+                    distance[cell] = distance[(x, y)] + 1
+                    parent[cell] = (x, y)
+                    if self.grid.is_cell_explored(*cell):
+                        queue.append(cell)
+        return distance, parent
+
+    def find_lowest_cost_move(self, available_moves):
+        distance, parent = self.travel_costs()
+        best, best_score = None, float('inf')
+        popped = []
+        # Every frontier cell is at least one step away, so once the heap
+        # key plus one can't beat the best score nothing left in it can
+        while self.heap and self.heap[0][0] + 1 < best_score:
+            key, version, cell = heapq.heappop(self.heap)
+            if version != self.version[cell] or self.grid.is_cell_explored(*cell):
+                continue
+            popped.append((key, version, cell))
+            if cell in distance and distance[cell] + key < best_score:
+                best, best_score = cell, distance[cell] + key
+        for entry in popped:
+            heapq.heappush(self.heap, entry)
+        if best is None:
+            return None
+
+        # Walk back from the target to the first step away from the robot
+        while parent[best] != (self.x, self.y):
+            best = parent[best]
+        return best
+
+    def move_to_cell(self, x, y):
+        super().move_to_cell(x, y)
+        self.push_frontier(x, y)
+
+def solve_maze(maze=None, robot_class=FrontierRobot, max_steps=None, time_budget=None):
+    # Initialize the maze and robot
+    maze = maze or generate_maze()
+    if max_steps is None:
+        max_steps = 4 * len(maze) * len(maze)
+    maze_grid = MazeGrid(len(maze))
+    maze_grid.initialize_cost_grid()
+    robot = robot_class(maze_grid, maze)
+    start = time.perf_counter()
+    seen_states = set()
+    outcome = REACHED
+
+    # Main solving loop, bounded by a step and a time budget
+    while (robot.x, robot.y) != maze_grid.center:
+        # 1. Scan current cell for walls
+        detected_walls = robot.scan_surrounding_walls()
+
+        # 2. Update the grid with new wall information
+        robot.update_grid_walls(detected_walls)
+        if maze_grid.costs[robot.y][robot.x] == float('inf'):
+            outcome = UNREACHABLE
+            break
+        # The next move depends on the known walls and on what is explored,
+        # so only a repeat of both at the same cell is a real loop
+        state = (robot.x, robot.y, maze_grid.walls_learned, maze_grid.explored_count)
+        if state in seen_states:
+            outcome = CYCLE
+            break
+        seen_states.add(state)
+        if robot.steps >= max_steps:
+            outcome = STEP_LIMIT
+            break
+        if time_budget is not None and time.perf_counter() - start > time_budget:
+            outcome = TIME_LIMIT
+            break
+
+        # 3. Get possible moves from current position
+        available_moves = robot.get_available_moves()
+
+        # 4. Find the best next move
+        next_move = robot.find_lowest_cost_move(available_moves)
+        if next_move is None:
+            outcome = UNREACHABLE
+            break
+
+        # 5. Move to the chosen cell
+        robot.move_to_cell(*next_move)
+
+    return {'outcome': outcome, 'steps': robot.steps, 'position': (robot.x, robot.y),
+            'elapsed': time.perf_counter() - start}
+
+def maze_seed(seed, index):
+    # Seed stream for maze number index, the same child SeedSequence.spawn
+    # would hand out, so any maze of a run can be rebuilt on its own
+    return np.random.SeedSequence(seed, spawn_key=(index,))
+
+def run_maze(task):
+    # One benchmark maze, regenerated from its seed inside the worker
+    size, extra_openings, seed, index = task
+    maze = generate_maze(size, extra_openings, maze_seed(seed, index))
+    return [solve_maze(maze, robot_class)['steps'] for robot_class in (Robot, FrontierRobot)]
+
+def check_outcomes(sizes=(8, 16, 24), mazes=10, seed=7):
+    # Every generated maze is connected, so anything but reaching the goal
+    # is a false cycle or budget report
+    runs = 0
+    for size in sizes:
+        for extra_openings in (0, 2 * size):
+            for i in range(mazes):
+                maze = generate_maze(size, extra_openings, maze_seed(seed, i))
+                for gain_weight in (0.5, 2.0):
+                    result = solve_maze(maze, lambda grid, maze: FrontierRobot(grid, maze, gain_weight))
+                    assert result['outcome'] == REACHED, (size, extra_openings, i, result)
+                    runs += 1
+                result = solve_maze(maze, Robot)
+                assert result['outcome'] == REACHED, (size, extra_openings, i, result)
+                runs += 1
+    print(f"{runs} runs on solvable mazes all reached the goal")
+
+def benchmark(size=16, mazes=100, seed=0, workers=1):
+    # Perfect mazes first, then the same size with loops knocked in. Mazes
+    # are seeded by index, not by worker, so any worker count gives the same
+    # numbers.
+    for extra_openings in (0, 2 * size):
+        tasks = [(size, extra_openings, seed, i) for i in range(mazes)]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                runs = list(pool.map(run_maze, tasks, chunksize=16))
+        else:
+            runs = [run_maze(task) for task in tasks]
+        print(f"{mazes} {size}x{size} mazes with {extra_openings} extra openings, seed {seed}")
+        for name, steps in zip(('Robot', 'FrontierRobot'), zip(*runs)):
+            print(f"{name:>13}: mean {sum(steps) / len(steps):7.1f} steps, "
+                  f"worst {max(steps)}")
+
+if __name__ == '__main__':
+    check_outcomes()
+    result = solve_maze(generate_maze(rng=0))
+    print(f"Finished: {result}")
+    benchmark()
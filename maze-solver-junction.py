@@ -0,0 +1,435 @@
+import heapq
+import time
+
+import numpy as np
+
+# Directions: 0=North, 1=East, 2=South, 3=West
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+WALL = 1
+OPEN = 0
+
+# Outcomes reported by JunctionRobot.run
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
+
+# Junction graph over a known cell maze (1 = wall, 0 = open).
+# Cells with exactly two open neighbours are corridor cells and get collapsed
+# into weighted edges between the remaining cells (junctions, dead ends and
+# the anchored start/goal/robot cells). Dead-end branches that can never lie
+# on a path between anchored cells are pruned from the active graph.
+class JunctionGraph:
+    def __init__(self, maze, anchors=()):
+        self.height = len(maze)
+        self.width = len(maze[0])
+        self.grid = [[int(cell) for cell in row] for row in maze]
+        self.anchors = set(anchors)
+
+        self.nodes = set()
+        self.edges = {}       # node -> {neighbour node: weight}
+        self.corridors = {}   # (node, neighbour) -> list of corridor cells, node excluded
+        self.cell_owner = {}  # corridor cell -> set of (node, neighbour) keys
+        self.dead = set()     # pruned dead-end nodes
+
+        self.build()
+
+    def is_open(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.grid[y][x] == OPEN
+
+    def open_directions(self, x, y):
+        return [i for i, (dx, dy) in enumerate(DIRECTIONS) if self.is_open(x + dx, y + dy)]
+
+    def is_node(self, x, y):
+        if not self.is_open(x, y):
+            return False
+        return (x, y) in self.anchors or len(self.open_directions(x, y)) != 2
+
+    # Walk from a node along direction d until the next node is reached
+    def trace(self, node, d):
+        cells = []
+        prev = node
+        x, y = node[0] + DIRECTIONS[d][0], node[1] + DIRECTIONS[d][1]
+        while not self.is_node(x, y):
+            cells.append((x, y))
+            # A corridor cell has exactly two exits, take the one we did not come from
+            for i in self.open_directions(x, y):
+                nx, ny = x + DIRECTIONS[i][0], y + DIRECTIONS[i][1]
+                if (nx, ny) != prev:
+                    break
+            prev = (x, y)
+            x, y = nx, ny
+        return (x, y), cells
+
+    def add_edge(self, a, b, cells):
+        if a == b:
+            return  # Loops back onto the same node, never useful for planning
+        weight = len(cells) + 1
+        if weight < self.edges[a].get(b, float('inf')):
+            self.remove_edge(a, b)
+            self.edges[a][b] = weight
+            self.edges[b][a] = weight
+            self.corridors[(a, b)] = cells
+            self.corridors[(b, a)] = cells[::-1]
+            for cell in cells:
+                self.cell_owner.setdefault(cell, set()).update(((a, b), (b, a)))
+
+    def remove_edge(self, a, b):
+        if b not in self.edges.get(a, {}):
+            return
+        del self.edges[a][b]
+        del self.edges[b][a]
+        for cell in self.corridors.pop((a, b)):
+            owners = self.cell_owner[cell]
+            owners.discard((a, b))
+            owners.discard((b, a))
+            if not owners:
+                del self.cell_owner[cell]
+        del self.corridors[(b, a)]
+
+    def connect(self, node):
+        for d in self.open_directions(*node):
+            other, cells = self.trace(node, d)
+            self.edges.setdefault(other, {})
+            self.add_edge(node, other, cells)
+
+    def build(self):
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.is_node(x, y):
+                    self.nodes.add((x, y))
+                    self.edges[(x, y)] = {}
+        for node in self.nodes:
+            self.connect(node)
+        self.prune(self.nodes)
+
+    def active_neighbours(self, node):
+        return [n for n in self.edges[node] if n not in self.dead]
+
+    # Peel off nodes with at most one live neighbour, starting from the given nodes
+    def prune(self, candidates):
+        worklist = list(candidates)
+        while worklist:
+            node = worklist.pop()
+            if node in self.anchors or node in self.dead or node not in self.nodes:
+                continue
+            live = self.active_neighbours(node)
+            if len(live) <= 1:
+                self.dead.add(node)
+                worklist.extend(live)
+
+    # Rebuild the part of the graph touched by changes at the given cells
+    def update(self, dirty_cells):
+        affected = set()
+        for cell in dirty_cells:
+            if cell in self.nodes:
+                affected.add(cell)
+                affected.update(self.edges[cell])
+            for a, b in self.cell_owner.get(cell, ()):
+                affected.update((a, b))
+
+        for cell in dirty_cells:
+            now_node = self.is_node(*cell)
+            if now_node and cell not in self.nodes:
+                self.nodes.add(cell)
+                self.edges[cell] = {}
+                affected.add(cell)
+            elif not now_node and cell in self.nodes:
+                for other in list(self.edges[cell]):
+                    self.remove_edge(cell, other)
+                self.nodes.discard(cell)
+                self.dead.discard(cell)
+                del self.edges[cell]
+                affected.discard(cell)
+
+        for node in affected:
+            for other in list(self.edges[node]):
+                self.remove_edge(node, other)
+        for node in affected:
+            self.connect(node)
+
+        # New walls only ever remove connectivity. The robot is pinned as an
+        # anchor on a live cell before its walls arrive (see JunctionRobot.sense),
+        # so earlier pruning stays valid and only needs extending
+        self.prune(affected)
+        return affected
+
+    def add_wall(self, x, y):
+        if self.grid[y][x] == WALL:
+            return set()
+        self.grid[y][x] = WALL
+        dirty = [(x, y)] + [(x + dx, y + dy) for dx, dy in DIRECTIONS if self.is_open(x + dx, y + dy)]
+        return self.update(dirty)
+
+    def set_anchor(self, cell, old=None):
+        if old is not None and old != cell:
+            self.anchors.discard(old)
+        self.anchors.add(cell)
+        self.dead.discard(cell)
+        dirty = [cell] if old is None or old == cell else [cell, old]
+        return self.update(dirty)
+
+    # Dijkstra from the goal over live nodes, the graph version of a flood fill
+    def distances_to(self, goal):
+        dist = {goal: 0}
+        heap = [(0, goal)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            for other in self.active_neighbours(node):
+                nd = d + self.edges[node][other]
+                if nd < dist.get(other, float('inf')):
+                    dist[other] = nd
+                    heapq.heappush(heap, (nd, other))
+        return dist
+
+    # Pick the next junction to head for, the graph version of choose_next_move
+    def next_node(self, node, dist):
+        best, best_cost = None, float('inf')
+        for other in self.active_neighbours(node):
+            cost = self.edges[node][other] + dist.get(other, float('inf'))
+            if cost < best_cost:
+                best, best_cost = other, cost
+        return best
+
+
+# Plain cell-by-cell BFS flood fill used as the baseline
+def cell_flood_fill(grid, goal):
+    height, width = len(grid), len(grid[0])
+    distances = [[-1] * width for _ in range(height)]
+    distances[goal[1]][goal[0]] = 0
+    queue = [goal]
+    head = 0
+    while head < len(queue):
+        x, y = queue[head]
+        head += 1
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and distances[ny][nx] == -1 and grid[ny][nx] == OPEN:
+                distances[ny][nx] = distances[y][x] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+# Robot driving the junction graph over a map it believes to be true.
+# Walls present in the real maze but missing from the known map are sensed
+# when the robot is next to them and folded into the graph incrementally.
+class JunctionRobot:
+    def __init__(self, maze, known_maze, start, goal, verbose=True):
+        self.maze = maze
+        self.start = start
+        self.goal = goal
+        self.position = start
+        self.anchor = start
+        self.graph = JunctionGraph(known_maze, anchors=(start, goal))
+        self.steps = 0
+        self.walls_learned = 0
+        self.verbose = verbose
+
+    def sense(self):
+        x, y = self.position
+        walls = [(x + dx, y + dy) for dx, dy in DIRECTIONS
+                 if self.graph.is_open(x + dx, y + dy) and self.maze[y + dy][x + dx] == WALL]
+        if not walls:
+            return False
+        # Pin the robot's cell first, otherwise pruning after the new walls can
+        # mark it and the way back as dead ends
+        if self.position != self.anchor:
+            self.graph.set_anchor(self.position, self.anchor)
+            self.anchor = self.position
+        for nx, ny in walls:
+            self.graph.add_wall(nx, ny)
+            if self.verbose:
+                print(f"Sensed wall at {(nx, ny)}")
+            self.walls_learned += 1
+        return True
+
+    def run(self, max_steps=None, time_budget=None):
+        # Bounded by a step and a time budget, returns a structured outcome
+        if max_steps is None:
+            max_steps = 4 * self.graph.width * self.graph.height
+        start = time.perf_counter()
+        seen_states = set()
+        outcome = REACHED
+
+        def over_budget():
+            if self.steps >= max_steps:
+                return STEP_LIMIT
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                return TIME_LIMIT
+            return None
+        self.sense()
+        dist = self.graph.distances_to(self.goal)
+        while self.position != self.goal:
+            # The flood fill is keyed from the goal, so a missing entry is O(1) proof
+            target = self.graph.next_node(self.position, dist)
+            if target is None or self.position not in dist:
+                outcome = UNREACHABLE
+                break
+            state = (self.position, self.walls_learned)
+            if state in seen_states:
+                outcome = CYCLE
+                break
+            seen_states.add(state)
+            if self.verbose:
+                print(f"Heading from {self.position} to junction {target}")
+            # Budgets are checked per cell, a long corridor must not overrun them
+            replan = False
+            stopped = None
+            for cell in self.graph.corridors[(self.position, target)] + [target]:
+                stopped = over_budget()
+                if stopped:
+                    break
+                self.position = cell
+                self.steps += 1
+                if self.sense():
+                    replan = True
+                    break
+            if stopped:
+                outcome = stopped
+                break
+            if replan:
+                dist = self.graph.distances_to(self.goal)
+        if self.verbose:
+            print("Goal reached!" if outcome == REACHED else f"Stopped: {outcome}")
+        return {'outcome': outcome, 'steps': self.steps, 'position': self.position,
+                'elapsed': time.perf_counter() - start}
+
+
+# Carve a perfect maze on an odd-sized cell grid, then open a few loops.
+def generate_sparse_maze(size, loops=0, rng=None):
+    rng = np.random.default_rng(rng)
+    maze = np.ones((size, size), dtype=int)
+    stack = [(1, 1)]
+    maze[1][1] = OPEN
+    while stack:
+        x, y = stack[-1]
+        options = []
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + 2 * dx, y + 2 * dy
+            if 0 < nx < size - 1 and 0 < ny < size - 1 and maze[ny][nx] == WALL:
+                options.append((nx, ny, dx, dy))
+        if options:
+            nx, ny, dx, dy = options[rng.integers(len(options))]
+            maze[y + dy][x + dx] = OPEN
+            maze[ny][nx] = OPEN
+            stack.append((nx, ny))
+        else:
+            stack.pop()
+    for _ in range(loops):
+        x, y = rng.integers(1, size - 1, size=2)
+        if (x + y) % 2 == 1:
+            maze[y][x] = OPEN
+    return maze
+
+
+# Fuzz the incremental updates: after every sensed wall the graph must match
+# one built from scratch, and the robot must reach every reachable goal
+def check_incremental(trials=300, size=21, hidden_walls=8, seed=0):
+    reachable = 0
+    for trial in range(trials):
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(trial,)))
+        known_maze = generate_sparse_maze(size, loops=size, rng=rng)
+        start, goal = (1, 1), (size // 2 | 1, size // 2 | 1)
+        maze = known_maze.copy()
+        open_cells = [(x, y) for y in range(size) for x in range(size)
+                      if maze[y][x] == OPEN and (x, y) not in (start, goal)]
+        for i in rng.choice(len(open_cells), size=hidden_walls, replace=False):
+            x, y = open_cells[i]
+            maze[y][x] = WALL
+
+        robot = JunctionRobot(maze, known_maze, start, goal, verbose=False)
+        sense = robot.sense
+
+        def checked_sense():
+            changed = sense()
+            graph = robot.graph
+            fresh = JunctionGraph(graph.grid, graph.anchors)
+            assert graph.nodes == fresh.nodes and graph.dead == fresh.dead, trial
+            assert graph.distances_to(goal) == fresh.distances_to(goal), trial
+            return changed
+
+        robot.sense = checked_sense
+        result = robot.run()
+        if cell_flood_fill(maze.tolist(), goal)[start[1]][start[0]] != -1:
+            reachable += 1
+            assert result['outcome'] == REACHED, (trial, result)
+        else:
+            assert result['outcome'] == UNREACHABLE, (trial, result)
+    print(f"{trials} incremental runs match fresh graphs, {reachable} goals reachable and reached")
+
+
+# Compare the cell flood fill with the junction graph on a large sparse maze
+def benchmark(size=301, loops=200, replans=20, seed=0):
+    rng = np.random.default_rng(seed)
+    maze = generate_sparse_maze(size, loops, rng)
+    start, goal = (1, 1), (size // 2 | 1, size // 2 | 1)
+    grid = maze.tolist()
+    open_cells = sum(row.count(OPEN) for row in grid)
+
+    t0 = time.perf_counter()
+    cell_flood_fill(grid, goal)
+    cell_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    graph = JunctionGraph(grid, anchors=(start, goal))
+    build_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    graph.distances_to(goal)
+    graph_time = time.perf_counter() - t0
+
+    live = len(graph.nodes) - len(graph.dead)
+    print(f"Maze {size}x{size}: {open_cells} open cells, "
+          f"{len(graph.nodes)} junction nodes, {live} after dead-end pruning")
+    print(f"Cell flood fill:        {cell_time * 1000:8.2f} ms")
+    print(f"Junction precompute:    {build_time * 1000:8.2f} ms (once)")
+    print(f"Junction flood fill:    {graph_time * 1000:8.2f} ms "
+          f"({cell_time / max(graph_time, 1e-9):.1f}x faster)")
+
+    # Replanning after each newly sensed wall
+    corridor_cells = list(graph.cell_owner)
+    rng.shuffle(corridor_cells)
+    walls = [cell for cell in corridor_cells if cell not in (start, goal)][:replans]
+    cell_total = graph_total = 0.0
+    for x, y in walls:
+        grid[y][x] = WALL
+        t0 = time.perf_counter()
+        cell_flood_fill(grid, goal)
+        cell_total += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        graph.add_wall(x, y)
+        graph.distances_to(goal)
+        graph_total += time.perf_counter() - t0
+    print(f"Replan after {len(walls)} new walls: cell {cell_total * 1000:.2f} ms, "
+          f"junction {graph_total * 1000:.2f} ms "
+          f"({cell_total / max(graph_total, 1e-9):.1f}x faster)")
+
+
+if __name__ == '__main__':
+    # Example maze from maze-solver-ds1.py (1 = wall, 0 = open)
+    maze = np.array([
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 1, 1, 0],
+        [0, 1, 0, 0, 0, 0, 0, 1, 0],
+        [0, 1, 0, 1, 1, 1, 0, 1, 0],
+        [0, 1, 0, 1, 0, 1, 0, 1, 0],
+        [0, 1, 0, 1, 0, 1, 0, 1, 0],
+        [0, 1, 0, 1, 1, 1, 0, 1, 0],
+        [0, 1, 0, 0, 0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 0]
+    ])
+
+    # The robot starts without knowing about the wall that blocks the top corridor
+    known_maze = maze.copy()
+    maze[0][4] = WALL
+
+    check_incremental()
+    robot = JunctionRobot(maze, known_maze, start=(0, 0), goal=(8, 8))
+    print(f"Finished: {robot.run()}")
+    benchmark()
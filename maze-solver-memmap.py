@@ -0,0 +1,159 @@
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from enum import Enum
+
+import numpy as np
+
+class Direction(Enum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+# Same orientation as maze-solver-claude2.py, NORTH is y+1. Each cell's walls
+# are packed into one byte, bit d set means a wall on side d, instead of the
+# four bools per cell the other solvers use.
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+NORTH_BIT = 1 << Direction.NORTH.value
+EAST_BIT = 1 << Direction.EAST.value
+SOUTH_BIT = 1 << Direction.SOUTH.value
+WEST_BIT = 1 << Direction.WEST.value
+
+def distance_dtype(maze_size):
+    # Smallest unsigned type that can hold every distance plus the unreachable marker
+    cells = maze_size * maze_size
+    for dtype in (np.uint16, np.uint32, np.uint64):
+        if cells < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+class MazeStorage:
+    # Flat wall and distance buffers, cell (x, y) at index y * maze_size + x.
+    # With a directory they are numpy.memmap files, otherwise ordinary arrays.
+    def __init__(self, maze_size, directory=None):
+        self.maze_size = maze_size
+        self.directory = directory
+        self.dtype = distance_dtype(maze_size)
+        self.unreachable = np.iinfo(self.dtype).max
+        cells = maze_size * maze_size
+        if directory is None:
+            self.walls = np.zeros(cells, dtype=np.uint8)
+            self.distances = np.zeros(cells, dtype=self.dtype)
+        else:
+            self.walls = np.memmap(os.path.join(directory, 'walls.u8'), dtype=np.uint8,
+                                   mode='w+', shape=(cells,))
+            self.distances = np.memmap(os.path.join(directory, f'distances.{self.dtype.name}'),
+                                       dtype=self.dtype, mode='w+', shape=(cells,))
+
+    def row_blocks(self, block_rows):
+        for y0 in range(0, self.maze_size, block_rows):
+            y1 = min(y0 + block_rows, self.maze_size)
+            yield y0, y1, slice(y0 * self.maze_size, y1 * self.maze_size)
+
+    def generate_maze(self, rng=None, block_rows=256, loops_per_row=4):
+        # Binary-tree maze written a block of rows at a time so the whole maze
+        # never has to sit in memory. Every cell opens north or east, the top
+        # row only east and the right column only north. A few extra west
+        # openings per row add loops. Each row draws from its own stream
+        # spawned off one root SeedSequence, so the maze does not depend on
+        # block_rows. A Generator rng supplies the root entropy from its
+        # next draws.
+        n = self.maze_size
+        if isinstance(rng, np.random.Generator):
+            root = np.random.SeedSequence(rng.integers(0, 2 ** 63, size=4).tolist())
+        elif isinstance(rng, np.random.SeedSequence):
+            root = rng
+        else:
+            root = np.random.SeedSequence(rng)
+        previous_north = np.zeros(n, dtype=bool)   # Row below the block opens north into it
+        for y0, y1, block in self.row_blocks(block_rows):
+            rows = y1 - y0
+            row_rngs = [np.random.default_rng(np.random.SeedSequence(
+                root.entropy, spawn_key=root.spawn_key + (y,))) for y in range(y0, y1)]
+            open_north = np.stack([rng.integers(0, 2, size=n) for rng in row_rngs]).astype(bool)
+            open_north[:, -1] = True
+            if y1 == n:
+                open_north[-1, :] = False
+            open_east = ~open_north
+            open_east[:, -1] = False
+
+            below = np.vstack([previous_north[None, :], open_north[:-1]])
+            left = np.hstack([np.zeros((rows, 1), dtype=bool), open_east[:, :-1]])
+
+            cells = np.zeros((rows, n), dtype=np.uint8)
+            cells |= np.where(open_north, 0, NORTH_BIT).astype(np.uint8)
+            cells |= np.where(open_east, 0, EAST_BIT).astype(np.uint8)
+            cells |= np.where(below, 0, SOUTH_BIT).astype(np.uint8)
+            cells |= np.where(left, 0, WEST_BIT).astype(np.uint8)
+
+            if loops_per_row:
+                ys = np.repeat(np.arange(rows), loops_per_row)
+                xs = np.concatenate([rng.integers(1, n, size=loops_per_row) for rng in row_rngs])
+                cells[ys, xs] &= ~np.uint8(WEST_BIT)
+                cells[ys, xs - 1] &= ~np.uint8(EAST_BIT)
+
+            self.walls[block] = cells.reshape(-1)
+            previous_north = open_north[-1]
+
+    def flood_fill(self, goal, block_rows=256):
+        # Level-synchronous BFS from the goal. Each level's frontier is kept
+        # as a sorted array of flat indices, so reads and writes sweep the
+        # memory-mapped buffers front to back instead of jumping around.
+        n = self.maze_size
+        for _, _, block in self.row_blocks(block_rows):
+            self.distances[block] = self.unreachable
+        steps = [dy * n + dx for dx, dy in MOVES]
+
+        goal_index = goal[1] * n + goal[0]
+        self.distances[goal_index] = 0
+        frontier = np.array([goal_index], dtype=np.int64)
+        level = 0
+        visited = 1
+        while frontier.size:
+            level += 1
+            walls = self.walls[frontier]
+            # Outer walls are always present, so no bounds checks are needed
+            candidates = np.concatenate([frontier[(walls & (1 << d)) == 0] + step
+                                         for d, step in enumerate(steps)])
+            candidates = np.unique(candidates)
+            frontier = candidates[self.distances[candidates] == self.unreachable]
+            self.distances[frontier] = level
+            visited += frontier.size
+        return visited, level - 1
+
+def peak_rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def benchmark(maze_size=2048, directory=None, seed=0):
+    cleanup = directory is None
+    directory = directory or tempfile.mkdtemp(prefix='maze-memmap-')
+    try:
+        storage = MazeStorage(maze_size, directory)
+        cells = maze_size * maze_size
+        print(f"Maze {maze_size}x{maze_size} ({cells:,} cells), distances as {storage.dtype.name}, "
+              f"buffers {(cells * (1 + storage.dtype.itemsize)) / 2 ** 20:.0f} MiB on disk "
+              f"(float64 field alone would be {cells * 8 / 2 ** 20:.0f} MiB)")
+
+        t0 = time.perf_counter()
+        storage.generate_maze(rng=seed)
+        generate_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        visited, depth = storage.flood_fill((maze_size // 2, maze_size // 2))
+        fill_time = time.perf_counter() - t0
+        storage.distances.flush()
+
+        print(f"Generate:   {generate_time:8.2f} s ({cells / generate_time / 1e6:.1f} M cells/s)")
+        print(f"Flood fill: {fill_time:8.2f} s ({visited / fill_time / 1e6:.1f} M cells/s), "
+              f"{visited:,} cells reached, depth {depth}")
+        print(f"Peak RSS:   {peak_rss_mib():8.0f} MiB (includes resident memmap pages)")
+    finally:
+        if cleanup:
+            shutil.rmtree(directory)
+
+# Pass a maze size to stress test, e.g. 10240 for just over 10^8 cells
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2048)
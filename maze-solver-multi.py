@@ -0,0 +1,328 @@
+import numpy as np
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from multiprocessing import shared_memory
+
+class Direction(Enum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+# Same layout as maze-solver-claude2.py: walls[y, x, direction], NORTH is y+1
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+OPPOSITE = [Direction.SOUTH.value, Direction.WEST.value, Direction.NORTH.value, Direction.EAST.value]
+
+# Real maze walls, installed once per worker so agents can sense without
+# shipping the whole maze on every task. The known map is not shipped either:
+# thread workers read the coordinator's array, process workers map the same
+# shared memory block. The coordinator only writes it between rounds.
+TRUE_WALLS = None
+KNOWN_WALLS = None
+KNOWN_WALLS_BLOCK = None
+
+def init_worker(walls, known_walls=None, block_name=None):
+    global TRUE_WALLS, KNOWN_WALLS, KNOWN_WALLS_BLOCK
+    TRUE_WALLS = walls
+    if block_name is not None:
+        KNOWN_WALLS_BLOCK = shared_memory.SharedMemory(name=block_name)
+        known_walls = np.ndarray(walls.shape, dtype=bool, buffer=KNOWN_WALLS_BLOCK.buf)
+    KNOWN_WALLS = known_walls
+
+def generate_maze(maze_size, extra_openings=None, rng=None):
+    # Iterative recursive backtracker, then knock out extra walls to create loops.
+    rng = np.random.default_rng(rng)
+    walls = np.ones((maze_size, maze_size, 4), dtype=bool)
+
+    def remove_wall(x, y, direction):
+        dx, dy = MOVES[direction]
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < maze_size and 0 <= ny < maze_size:
+            walls[y, x, direction] = False
+            walls[ny, nx, OPPOSITE[direction]] = False
+
+    visited = np.zeros((maze_size, maze_size), dtype=bool)
+    visited[0, 0] = True
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        directions = [d for d, (dx, dy) in enumerate(MOVES)
+                      if 0 <= x + dx < maze_size and 0 <= y + dy < maze_size
+                      and not visited[y + dy, x + dx]]
+        if directions:
+            direction = rng.choice(directions)
+            remove_wall(x, y, direction)
+            nx, ny = x + MOVES[direction][0], y + MOVES[direction][1]
+            visited[ny, nx] = True
+            stack.append((nx, ny))
+        else:
+            stack.pop()
+
+    if extra_openings is None:
+        extra_openings = maze_size
+    for _ in range(extra_openings):
+        remove_wall(rng.integers(0, maze_size), rng.integers(0, maze_size), rng.integers(0, 4))
+    return walls
+
+def plan_path(known_walls, start, target):
+    # BFS over the known map, unknown walls are assumed open
+    maze_size = known_walls.shape[0]
+    parent = {tuple(start): None}
+    queue = deque([tuple(start)])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == target:
+            path = []
+            cell = (x, y)
+            while parent[cell] is not None:
+                path.append(cell)
+                cell = parent[cell]
+            return path[::-1]
+        for direction, (dx, dy) in enumerate(MOVES):
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < maze_size and 0 <= ny < maze_size and
+                    not known_walls[y, x, direction] and (nx, ny) not in parent):
+                parent[(nx, ny)] = (x, y)
+                queue.append((nx, ny))
+    return None
+
+def explore_batch(task):
+    # One agent's share of a round: plan on the shared map, which stays
+    # unchanged until the round is over, walk up to batch_steps cells and
+    # return what was sensed on the way. Nothing shared is written here, the
+    # coordinator merges the observations.
+    agent_id, position, target, batch_steps = task
+    x, y = position
+    observations = [(x, y, TRUE_WALLS[y, x].copy())]
+    path = plan_path(KNOWN_WALLS, (x, y), target)
+    if path is None:
+        return agent_id, (x, y), observations, 0, True
+
+    steps = 0
+    for nx, ny in path[:batch_steps]:
+        direction = MOVES.index((nx - x, ny - y))
+        if TRUE_WALLS[y, x, direction]:
+            break  # Just sensed a wall on the planned route, wait for a replan
+        x, y = nx, ny
+        steps += 1
+        observations.append((x, y, TRUE_WALLS[y, x].copy()))
+    return agent_id, (x, y), observations, steps, False
+
+class MicroMouse:
+    def __init__(self, agent_id, position):
+        self.agent_id = agent_id
+        self.position = tuple(position)
+        self.target = None
+        self.steps = 0
+
+class FrontierIndex:
+    # Unsensed cells bucketed into bucket x bucket squares. The nearest one is
+    # found by scanning rings of buckets outwards from the agent, instead of
+    # walking the whole frontier.
+    def __init__(self, maze_size, bucket=8):
+        self.bucket = bucket
+        self.buckets_per_side = -(-maze_size // bucket)
+        self.buckets = {}
+        self.size = 0
+        for y in range(maze_size):
+            for x in range(maze_size):
+                self.buckets.setdefault((x // bucket, y // bucket), set()).add((x, y))
+                self.size += 1
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, cell):
+        return cell in self.buckets.get((cell[0] // self.bucket, cell[1] // self.bucket), ())
+
+    def discard(self, cell):
+        cells = self.buckets.get((cell[0] // self.bucket, cell[1] // self.bucket))
+        if cells is not None and cell in cells:
+            cells.remove(cell)
+            self.size -= 1
+
+    def ring(self, bx, by, r):
+        for ox in range(-r, r + 1):
+            for oy in range(-r, r + 1):
+                if max(abs(ox), abs(oy)) == r:
+                    yield bx + ox, by + oy
+
+    def nearest(self, x, y, claimed, tie_break):
+        # Closest cell by Manhattan distance, ties broken by tie_break(cell).
+        # Every cell r + 1 rings out is more than r * bucket steps away, so
+        # the search stops as soon as the best so far is no further than that.
+        bx, by = x // self.bucket, y // self.bucket
+        best, best_key = None, None
+        for r in range(self.buckets_per_side):
+            for key in self.ring(bx, by, r):
+                for cell in self.buckets.get(key, ()):
+                    if cell in claimed:
+                        continue
+                    cell_key = (abs(cell[0] - x) + abs(cell[1] - y), tie_break(cell))
+                    if best_key is None or cell_key < best_key:
+                        best, best_key = cell, cell_key
+            if best is not None and best_key[0] <= r * self.bucket:
+                break
+        return best
+
+class SharedMap:
+    def __init__(self, maze_size, goal):
+        self.maze_size = maze_size
+        self.goal = tuple(goal)
+        self.known_walls = np.zeros((maze_size, maze_size, 4), dtype=bool)
+        self.sensed = np.zeros((maze_size, maze_size), dtype=bool)
+        self.frontier = FrontierIndex(maze_size)
+
+        # Distance field to the goal, kept up to date incrementally as walls arrive
+        self.unreachable = maze_size * maze_size
+        self.flood_values = np.full((maze_size, maze_size), self.unreachable, dtype=np.int32)
+        self.full_flood_fill()
+
+    def open_neighbours(self, x, y):
+        for direction, (dx, dy) in enumerate(MOVES):
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
+                    not self.known_walls[y, x, direction]):
+                yield nx, ny
+
+    def full_flood_fill(self):
+        self.flood_values[:, :] = self.unreachable
+        gx, gy = self.goal
+        self.flood_values[gy, gx] = 0
+        queue = deque([self.goal])
+        while queue:
+            x, y = queue.popleft()
+            for nx, ny in self.open_neighbours(x, y):
+                if self.flood_values[ny, nx] > self.flood_values[y, x] + 1:
+                    self.flood_values[ny, nx] = self.flood_values[y, x] + 1
+                    queue.append((nx, ny))
+
+    def repair_flood_values(self, cells):
+        # Modified flood fill: walls only add, so distances only grow. Fix every
+        # cell that no longer sits one above its best neighbour and let the
+        # change ripple outwards, leaving the rest of the field untouched.
+        stack = list(cells)
+        while stack:
+            x, y = stack.pop()
+            if (x, y) == self.goal:
+                continue
+            best = min((self.flood_values[ny, nx] for nx, ny in self.open_neighbours(x, y)),
+                       default=self.unreachable)
+            value = min(best + 1, self.unreachable)
+            if value != self.flood_values[y, x]:
+                self.flood_values[y, x] = value
+                stack.extend(self.open_neighbours(x, y))
+
+    def merge(self, observations):
+        # Batched merge of one round of wall observations from every agent
+        dirty = []
+        for x, y, walls in observations:
+            if self.sensed[y, x]:
+                continue
+            self.sensed[y, x] = True
+            self.frontier.discard((x, y))
+            for direction in np.flatnonzero(walls & ~self.known_walls[y, x]):
+                dx, dy = MOVES[direction]
+                self.known_walls[y, x, direction] = True
+                dirty.append((x, y))
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.maze_size and 0 <= ny < self.maze_size:
+                    self.known_walls[ny, nx, OPPOSITE[direction]] = True
+                    dirty.append((nx, ny))
+        self.repair_flood_values(dirty)
+
+class Coordinator:
+    def __init__(self, walls, num_agents=4, start=(0, 0), batch_steps=4, executor='thread',
+                 max_rounds=None):
+        self.walls = walls
+        self.maze_size = walls.shape[0]
+        self.shared = SharedMap(self.maze_size, (self.maze_size // 2, self.maze_size // 2))
+        self.agents = [MicroMouse(i, start) for i in range(num_agents)]
+        self.batch_steps = batch_steps
+        self.executor = executor
+        if max_rounds is None:
+            max_rounds = 4 * self.maze_size * self.maze_size
+        self.max_rounds = max_rounds
+        self.rounds = 0
+
+    def assign_targets(self):
+        # Give every idle agent the closest frontier cell nobody else is after,
+        # preferring cells the shared flood field says are nearer the goal
+        claimed = {agent.target for agent in self.agents if agent.target is not None}
+        for agent in self.agents:
+            if agent.target is not None and agent.target in self.shared.frontier:
+                continue
+            claimed.discard(agent.target)
+            agent.target = None
+            x, y = agent.position
+            best = self.shared.frontier.nearest(
+                x, y, claimed, lambda cell: self.shared.flood_values[cell[1], cell[0]])
+            if best is not None:
+                agent.target = best
+                claimed.add(best)
+
+    def run(self):
+        if self.executor == 'process':
+            # Move the known map into shared memory so rounds ship no walls
+            known_walls = self.shared.known_walls
+            block = shared_memory.SharedMemory(create=True, size=known_walls.nbytes)
+            self.shared.known_walls = np.ndarray(known_walls.shape, dtype=bool, buffer=block.buf)
+            self.shared.known_walls[:] = known_walls
+            pool = ProcessPoolExecutor(max_workers=len(self.agents), initializer=init_worker,
+                                       initargs=(self.walls, None, block.name))
+        else:
+            block = None
+            pool = ThreadPoolExecutor(max_workers=len(self.agents), initializer=init_worker,
+                                      initargs=(self.walls, self.shared.known_walls))
+        try:
+            self.explore(pool)
+        finally:
+            pool.shutdown()
+            if block is not None:
+                self.shared.known_walls = self.shared.known_walls.copy()
+                block.close()
+                block.unlink()
+        return self.shared
+
+    def explore(self, pool):
+        # Rounds of plan-and-walk in the pool, each followed by one batched merge
+        while self.shared.frontier and self.rounds < self.max_rounds:
+            self.assign_targets()
+            active = [agent for agent in self.agents if agent.target is not None]
+            if not active:
+                break
+            tasks = [(agent.agent_id, agent.position, agent.target, self.batch_steps)
+                     for agent in active]
+            observations = []
+            for agent_id, position, sensed, steps, unreachable in pool.map(explore_batch, tasks):
+                agent = self.agents[agent_id]
+                agent.position = position
+                agent.steps += steps
+                observations.extend(sensed)
+                if unreachable:
+                    # Walled off on the known map, so it can never be visited
+                    self.shared.frontier.discard(agent.target)
+                    agent.target = None
+            self.shared.merge(observations)
+            self.rounds += 1
+
+def benchmark(maze_size=32, agent_counts=(1, 2, 4, 8), executors=('thread', 'process'), seed=0):
+    walls = generate_maze(maze_size, rng=seed)
+    print(f"Mapping a {maze_size}x{maze_size} maze")
+    for executor in executors:
+        for num_agents in agent_counts:
+            coordinator = Coordinator(walls, num_agents=num_agents, executor=executor)
+            start = time.perf_counter()
+            shared = coordinator.run()
+            elapsed = time.perf_counter() - start
+            total_steps = sum(agent.steps for agent in coordinator.agents)
+            print(f"{executor:>7} x{num_agents}: {coordinator.rounds:5d} rounds, "
+                  f"{total_steps:6d} total steps, "
+                  f"{int(shared.sensed.sum())}/{maze_size * maze_size} cells mapped, "
+                  f"goal distance {shared.flood_values[0, 0]}, {elapsed:.2f}s")
+
+# Run the scaling study
+if __name__ == '__main__':
+    benchmark()
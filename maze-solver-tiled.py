@@ -0,0 +1,357 @@
+import heapq
+import time
+from collections import deque
+from enum import Enum
+
+import numpy as np
+
+class Direction(Enum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+# Outcomes reported by MicroMouse.run
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
+# Same layout as maze-solver-claude2.py: walls[y, x, direction], NORTH is y+1
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+OPPOSITE = [Direction.SOUTH.value, Direction.WEST.value, Direction.NORTH.value, Direction.EAST.value]
+
+def generate_maze(maze_size, extra_openings=None, rng=None):
+    # Vectorised binary-tree maze: every cell opens either north or east, which
+    # is fast enough for 1024x1024 grids. Extra openings add loops.
+    rng = np.random.default_rng(rng)
+    walls = np.ones((maze_size, maze_size, 4), dtype=bool)
+    open_north = rng.integers(0, 2, size=(maze_size, maze_size)).astype(bool)
+    open_north[-1, :] = False          # Top row can only go east
+    open_north[:, -1] = True           # Right column can only go north
+    open_north[-1, -1] = False
+    open_east = ~open_north
+    open_east[-1, -1] = False
+
+    walls[:, :, Direction.NORTH.value] &= ~open_north
+    walls[1:, :, Direction.SOUTH.value] &= ~open_north[:-1, :]
+    walls[:, :, Direction.EAST.value] &= ~open_east
+    walls[:, 1:, Direction.WEST.value] &= ~open_east[:, :-1]
+
+    if extra_openings is None:
+        extra_openings = maze_size * 4
+    xs = rng.integers(1, maze_size - 1, size=extra_openings)
+    ys = rng.integers(1, maze_size - 1, size=extra_openings)
+    for x, y in zip(xs, ys):
+        walls[y, x, Direction.WEST.value] = False
+        walls[y, x - 1, Direction.EAST.value] = False
+    return walls
+
+def full_flood_fill(walls, goal):
+    # Baseline: one BFS over the whole grid, as the single-level solvers do
+    maze_size = walls.shape[0]
+    distances = np.full((maze_size, maze_size), -1, dtype=np.int32)
+    distances[goal[1], goal[0]] = 0
+    queue = deque([goal])
+    while queue:
+        x, y = queue.popleft()
+        for direction, (dx, dy) in enumerate(MOVES):
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < maze_size and 0 <= ny < maze_size and
+                    not walls[y, x, direction] and distances[ny, nx] == -1):
+                distances[ny, nx] = distances[y, x] + 1
+                queue.append((nx, ny))
+    return distances
+
+class TiledPlanner:
+    # Two-level planner. The maze is cut into tile_size x tile_size tiles.
+    # Border cells with an opening into a neighbouring tile are the nodes of
+    # an abstract graph; inside a tile they are linked by border-to-border
+    # distances, across tiles by a single step. Tables are filled per tile on
+    # first use and thrown away only for tiles whose walls change.
+    def __init__(self, walls, tile_size=32):
+        self.walls = walls
+        self.maze_size = walls.shape[0]
+        self.tile_size = tile_size
+        self.border_cache = {}   # tile -> list of border nodes
+        self.tables = {}         # tile -> {border node: {border node: distance}}
+        self.tiles_computed = 0
+
+    def tile_of(self, x, y):
+        return (x // self.tile_size, y // self.tile_size)
+
+    def tile_bounds(self, tile):
+        x0, y0 = tile[0] * self.tile_size, tile[1] * self.tile_size
+        return x0, y0, min(x0 + self.tile_size, self.maze_size), min(y0 + self.tile_size, self.maze_size)
+
+    def crossings(self, x, y):
+        # Neighbouring cells in another tile reachable in one step
+        tile = self.tile_of(x, y)
+        result = []
+        for direction, (dx, dy) in enumerate(MOVES):
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
+                    not self.walls[y, x, direction] and self.tile_of(nx, ny) != tile):
+                result.append((nx, ny))
+        return result
+
+    def border_nodes(self, tile):
+        if tile not in self.border_cache:
+            x0, y0, x1, y1 = self.tile_bounds(tile)
+            perimeter = set()
+            for x in range(x0, x1):
+                perimeter.update(((x, y0), (x, y1 - 1)))
+            for y in range(y0, y1):
+                perimeter.update(((x0, y), (x1 - 1, y)))
+            self.border_cache[tile] = [cell for cell in sorted(perimeter) if self.crossings(*cell)]
+        return self.border_cache[tile]
+
+    def tile_bfs(self, tile, source, target=None):
+        # BFS confined to one tile, stopping early once target is found
+        x0, y0, x1, y1 = self.tile_bounds(tile)
+        parent = {source: None}
+        distance = {source: 0}
+        queue = deque([source])
+        while queue:
+            x, y = queue.popleft()
+            if (x, y) == target:
+                break
+            for direction, (dx, dy) in enumerate(MOVES):
+                nx, ny = x + dx, y + dy
+                if (x0 <= nx < x1 and y0 <= ny < y1 and
+                        not self.walls[y, x, direction] and (nx, ny) not in distance):
+                    distance[(nx, ny)] = distance[(x, y)] + 1
+                    parent[(nx, ny)] = (x, y)
+                    queue.append((nx, ny))
+        return distance, parent
+
+    def distances_from(self, cell, targets):
+        distance, _ = self.tile_bfs(self.tile_of(*cell), cell)
+        return {target: distance[target] for target in targets
+                if target in distance and target != cell}
+
+    def table(self, tile):
+        if tile not in self.tables:
+            nodes = self.border_nodes(tile)
+            self.tables[tile] = {node: self.distances_from(node, nodes) for node in nodes}
+            self.tiles_computed += 1
+        return self.tables[tile]
+
+    def invalidate(self, x, y):
+        tile = self.tile_of(x, y)
+        self.tables.pop(tile, None)
+        self.border_cache.pop(tile, None)
+
+    def set_wall(self, x, y, direction):
+        # Only the tables of the one or two tiles on either side go stale
+        dx, dy = MOVES[direction]
+        nx, ny = x + dx, y + dy
+        self.walls[y, x, direction] = True
+        self.invalidate(x, y)
+        if 0 <= nx < self.maze_size and 0 <= ny < self.maze_size:
+            self.walls[ny, nx, OPPOSITE[direction]] = True
+            self.invalidate(nx, ny)
+
+    def plan_abstract(self, start, goal):
+        # A* over border nodes with a Manhattan heuristic
+        start_tile, goal_tile = self.tile_of(*start), self.tile_of(*goal)
+        start_targets = list(self.border_nodes(start_tile))
+        if start_tile == goal_tile:
+            start_targets.append(goal)
+        from_start = self.distances_from(start, start_targets)
+        to_goal = self.distances_from(goal, self.border_nodes(goal_tile))
+
+        def heuristic(cell):
+            return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])
+
+        best = {start: 0}
+        parent = {start: None}
+        heap = [(heuristic(start), 0, start)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            if cell == goal:
+                path = []
+                while cell is not None:
+                    path.append(cell)
+                    cell = parent[cell]
+                return path[::-1]
+            if g > best[cell]:
+                continue
+
+            if cell == start:
+                # A start on the tile border can also step straight across
+                neighbours = [(other, 1) for other in self.crossings(*cell)]
+                neighbours += list(from_start.items())
+            else:
+                neighbours = [(other, 1) for other in self.crossings(*cell)]
+                neighbours += list(self.table(self.tile_of(*cell))[cell].items())
+                if cell in to_goal:
+                    neighbours.append((goal, to_goal[cell]))
+            for other, weight in neighbours:
+                cost = g + weight
+                if cost < best.get(other, float('inf')):
+                    best[other] = cost
+                    parent[other] = cell
+                    heapq.heappush(heap, (cost + heuristic(other), cost, other))
+        return None
+
+    def refine(self, abstract_path):
+        # Expand the abstract path into cells, touching only tiles on the path
+        path = [abstract_path[0]]
+        for a, b in zip(abstract_path, abstract_path[1:]):
+            if self.tile_of(*a) != self.tile_of(*b):
+                path.append(b)
+                continue
+            _, parent = self.tile_bfs(self.tile_of(*a), a, target=b)
+            segment = []
+            cell = b
+            while cell != a:
+                segment.append(cell)
+                cell = parent[cell]
+            path.extend(reversed(segment))
+        return path
+
+    def plan(self, start, goal):
+        abstract_path = self.plan_abstract(tuple(start), tuple(goal))
+        if abstract_path is None:
+            return None
+        return self.refine(abstract_path)
+
+class MicroMouse:
+    # Explores an unknown maze with the tiled planner, assuming unseen walls
+    # are open and replanning whenever a sensed wall blocks the current route
+    def __init__(self, walls, tile_size=32):
+        self.maze_size = walls.shape[0]
+        self.walls = walls
+        self.position = (0, 0)
+        self.goal = (self.maze_size // 2, self.maze_size // 2)
+        self.planner = TiledPlanner(np.zeros_like(walls), tile_size)
+        self.planner.walls[0, :, Direction.SOUTH.value] = True
+        self.planner.walls[-1, :, Direction.NORTH.value] = True
+        self.planner.walls[:, 0, Direction.WEST.value] = True
+        self.planner.walls[:, -1, Direction.EAST.value] = True
+        self.steps = 0
+        self.replans = 0
+        self.walls_learned = 0
+
+    def sense_walls(self):
+        x, y = self.position
+        new_walls = False
+        for direction in range(4):
+            if self.walls[y, x, direction] and not self.planner.walls[y, x, direction]:
+                self.planner.set_wall(x, y, direction)
+                self.walls_learned += 1
+                new_walls = True
+        return new_walls
+
+    def run(self, max_steps=None, time_budget=None):
+        # Bounded by a step and a time budget, returns a structured outcome
+        if max_steps is None:
+            max_steps = 4 * self.maze_size * self.maze_size
+        start = time.perf_counter()
+        seen_states = set()
+        outcome = REACHED
+        self.sense_walls()
+        path = self.planner.plan(self.position, self.goal)
+        while self.position != self.goal:
+            if path is None:
+                outcome = UNREACHABLE
+                break
+            state = (self.position, self.walls_learned)
+            if state in seen_states:
+                outcome = CYCLE
+                break
+            seen_states.add(state)
+            if self.steps >= max_steps:
+                outcome = STEP_LIMIT
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                outcome = TIME_LIMIT
+                break
+            self.position = path[1]
+            path = path[1:]
+            self.steps += 1
+            if self.sense_walls():
+                self.replans += 1
+                path = self.planner.plan(self.position, self.goal)
+        return {'outcome': outcome, 'steps': self.steps, 'position': self.position,
+                'elapsed': time.perf_counter() - start}
+
+def benchmark(maze_size=1024, tile_size=32, wall_changes=20, seed=0):
+    # Enough loops that blocking the route usually leaves a way round
+    walls = generate_maze(maze_size, extra_openings=16 * maze_size, rng=seed)
+    start, goal = (0, 0), (maze_size // 2, maze_size // 2)
+    print(f"Maze {maze_size}x{maze_size}, tiles {tile_size}x{tile_size}")
+
+    t0 = time.perf_counter()
+    distances = full_flood_fill(walls, goal)
+    flat_time = time.perf_counter() - t0
+
+    planner = TiledPlanner(walls.copy(), tile_size)
+    t0 = time.perf_counter()
+    path = planner.plan(start, goal)
+    cold_time = time.perf_counter() - t0
+    assert len(path) - 1 == distances[start[1], start[0]]
+
+    t0 = time.perf_counter()
+    planner.plan(start, goal)
+    warm_time = time.perf_counter() - t0
+
+    # Block corridors on the chosen path and replan each time
+    replan_time = 0.0
+    replans = 0
+    for i in range(1, wall_changes + 1):
+        (x, y), (nx, ny) = path[i * len(path) // (wall_changes + 2):][:2]
+        planner.set_wall(x, y, MOVES.index((nx - x, ny - y)))
+        t0 = time.perf_counter()
+        path = planner.plan(start, goal)
+        replan_time += time.perf_counter() - t0
+        replans += 1
+        if path is None:
+            # Only acceptable if the new walls really cut the goal off
+            assert full_flood_fill(planner.walls, goal)[start[1], start[0]] == -1
+            print(f"Goal cut off after {replans} wall changes")
+            break
+
+    tiles = (maze_size // tile_size) ** 2
+    table_entries = sum(len(row) for table in planner.tables.values() for row in table.values())
+    print(f"Full flood fill:     {flat_time * 1000:9.1f} ms, "
+          f"float64 grid {maze_size * maze_size * 8 / 2 ** 20:.1f} MiB")
+    print(f"Tiled plan (cold):   {cold_time * 1000:9.1f} ms, "
+          f"{planner.tiles_computed}/{tiles} tiles tabled")
+    print(f"Tiled plan (warm):   {warm_time * 1000:9.1f} ms")
+    print(f"Tiled replan:        {replan_time / replans * 1000:9.1f} ms per wall change, "
+          f"{table_entries} table entries cached")
+
+def check_plans(maze_size=32, tile_size=8, queries=600, rng=0):
+    # Compare tiled plan lengths with a full flood fill for random starts,
+    # half of them drawn from tile border cells
+    rng = np.random.default_rng(rng)
+    walls = generate_maze(maze_size, rng=rng)
+    planner = TiledPlanner(walls, tile_size)
+    border = [cell for tile in {planner.tile_of(x, y) for x in range(maze_size) for y in range(maze_size)}
+              for cell in planner.border_nodes(tile)]
+    for i in range(queries):
+        goal = tuple(int(v) for v in rng.integers(0, maze_size, size=2))
+        if i % 2:
+            start = border[rng.integers(len(border))]
+        else:
+            start = tuple(int(v) for v in rng.integers(0, maze_size, size=2))
+        expected = full_flood_fill(walls, goal)[start[1], start[0]]
+        path = planner.plan(start, goal)
+        length = -1 if path is None else len(path) - 1
+        assert length == expected, (start, goal, length, expected)
+        assert path is None or all(
+            abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and
+            not walls[a[1], a[0], MOVES.index((b[0] - a[0], b[1] - a[1]))]
+            for a, b in zip(path, path[1:]))
+    print(f"{queries} tiled plans match the full flood fill")
+
+# Check the planner, explore a small maze, then time a large one
+if __name__ == '__main__':
+    check_plans()
+    mouse = MicroMouse(generate_maze(64, rng=0), tile_size=16)
+    result = mouse.run()
+    print(f"Finished: {result}, {mouse.replans} replans")
+    benchmark()
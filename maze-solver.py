@@ -13,6 +13,13 @@ EAST = 1
 SOUTH = 2
 WEST = 3
 
+# Outcomes reported by the simulation loop
+REACHED = 'reached'
+UNREACHABLE = 'unreachable'
+CYCLE = 'cycle'
+STEP_LIMIT = 'step_limit'
+TIME_LIMIT = 'time_limit'
+
 # Robot movements
 MOVES = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # North, East, South, West
 
@@ -33,9 +40,15 @@ maze = [
 robot_pos = (1, 1)  # Starting position
 robot_dir = EAST  # Starting direction
 
+# Goal is the center of the maze
+goal = (MAZE_SIZE // 2, MAZE_SIZE // 2)
+
 # Flood fill distance grid
 distance = [[0 for _ in range(MAZE_SIZE)] for _ in range(MAZE_SIZE)]
 
+# Number of walls learned so far, part of the state used for cycle detection
+walls_learned = 0
+
 
 def print_maze():
     for y in range(MAZE_SIZE):
@@ -85,7 +98,6 @@ def update_flood_fill():
                 distance[y][x] = float('inf')  # Initialize to infinity
 
     # Start from the goal (center of the maze)
-    goal = (MAZE_SIZE // 2, MAZE_SIZE // 2)
     queue = [goal]
     distance[goal[1]][goal[0]] = 0
 
@@ -114,6 +126,18 @@ def choose_next_move(x, y):
     return best_move
 
 
+def goal_unreachable(x, y):
+    # O(1) check after a fill: the robot's cell was never reached from the goal
+    return maze[goal[1]][goal[0]] == WALL or distance[y][x] == float('inf')
+
+
+def mark_wall(nx, ny):
+    global walls_learned
+    if maze[ny][nx] != WALL:
+        maze[ny][nx] = WALL
+        walls_learned += 1
+
+
 def move_robot():
     global robot_pos, robot_dir
 
@@ -124,20 +148,23 @@ def move_robot():
     if walls[0]:  # Front wall
         nx, ny = x + MOVES[robot_dir][0], y + MOVES[robot_dir][1]
         if 0 <= nx < MAZE_SIZE and 0 <= ny < MAZE_SIZE:
-            maze[ny][nx] = WALL
+            mark_wall(nx, ny)
     if walls[1]:  # Left wall
         left_dir = (robot_dir - 1) % 4
         nx, ny = x + MOVES[left_dir][0], y + MOVES[left_dir][1]
         if 0 <= nx < MAZE_SIZE and 0 <= ny < MAZE_SIZE:
-            maze[ny][nx] = WALL
+            mark_wall(nx, ny)
     if walls[2]:  # Right wall
         right_dir = (robot_dir + 1) % 4
         nx, ny = x + MOVES[right_dir][0], y + MOVES[right_dir][1]
         if 0 <= nx < MAZE_SIZE and 0 <= ny < MAZE_SIZE:
-            maze[ny][nx] = WALL
+            mark_wall(nx, ny)
 
     # Update flood fill distances
     update_flood_fill()
+    if goal_unreachable(x, y):
+        print("Goal unreachable")
+        return False
 
     # Choose next move
     next_move = choose_next_move(x, y)
@@ -158,14 +185,45 @@ def move_robot():
             robot_pos = (nx, ny)
             maze[ny][nx] = VISITED
             print(f"Moving to ({nx}, {ny})")
-        else:
-            print("Cannot move forward")
+            return True
+        print("Cannot move forward")
     else:
         print("No valid moves")
+    return False
+
+
+# Main simulation loop, bounded by a step and a time budget
+def simulate(max_steps=4 * MAZE_SIZE * MAZE_SIZE, time_budget=None, delay=1):
+    start = time.perf_counter()
+    steps = 0
+    seen_states = set()
+    outcome = REACHED
+    while robot_pos != goal:
+        # Same position, heading and wall knowledge again means the robot loops
+        state = (robot_pos, robot_dir, walls_learned)
+        if state in seen_states:
+            outcome = CYCLE
+            break
+        seen_states.add(state)
+        if steps >= max_steps:
+            outcome = STEP_LIMIT
+            break
+        if time_budget is not None and time.perf_counter() - start > time_budget:
+            outcome = TIME_LIMIT
+            break
+
+        print_maze()
+        if not move_robot():
+            outcome = UNREACHABLE
+            break
+        steps += 1
+        time.sleep(delay)  # Pause between frames
 
-
-# Main simulation loop
-while True:
     print_maze()
-    move_robot()
-    time.sleep(1)  # Pause for 1 second between frames
\ No newline at end of file
+    result = {'outcome': outcome, 'steps': steps, 'position': robot_pos,
+              'elapsed': time.perf_counter() - start}
+    print(f"Finished: {result}")
+    return result
+
+
+simulate()
\ No newline at end of file